@@ -1,13 +1,30 @@
 """CLI entry point for hobbes."""
 
+import importlib
+
 import click
 from rich.console import Console
 
 from hobbes import __version__
-from hobbes.commands import install, uninstall, update, list_cmd, search, info, outdated, pin, self_update
 
 console = Console()
 
+# Command name -> (module, attribute). Modules are imported only when the
+# command is dispatched, so short commands don't pay for unrelated imports.
+COMMANDS = {
+    "install": ("hobbes.commands.install", "install"),
+    "uninstall": ("hobbes.commands.uninstall", "uninstall"),
+    "update": ("hobbes.commands.update", "update"),
+    "upgrade-all": ("hobbes.commands.update", "upgrade_all"),
+    "list": ("hobbes.commands.list_cmd", "list_packages"),
+    "search": ("hobbes.commands.search", "search"),
+    "info": ("hobbes.commands.info", "info"),
+    "outdated": ("hobbes.commands.outdated", "outdated"),
+    "pin": ("hobbes.commands.pin", "pin"),
+    "unpin": ("hobbes.commands.pin", "unpin"),
+    "self-update": ("hobbes.commands.self_update", "self_update"),
+}
+
 BANNER = r"""
  __              __       __
 /\ \            /\ \     /\ \
@@ -19,7 +36,21 @@ BANNER = r"""
 """
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports command modules on demand."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in COMMANDS:
+            return None
+        module_name, attr = COMMANDS[cmd_name]
+        module = importlib.import_module(module_name)
+        return getattr(module, attr)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="hobbes")
 def main():
     """Hobbes - A package manager for GitHub release binaries.
@@ -39,19 +70,5 @@ def main():
     console.print(BANNER, style="bold blue", highlight=False)
 
 
-# Register commands
-main.add_command(install.install)
-main.add_command(uninstall.uninstall)
-main.add_command(update.update)
-main.add_command(update.upgrade_all)
-main.add_command(list_cmd.list_packages)
-main.add_command(search.search)
-main.add_command(info.info)
-main.add_command(outdated.outdated)
-main.add_command(pin.pin)
-main.add_command(pin.unpin)
-main.add_command(self_update.self_update)
-
-
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 """Info command implementation."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 from rich.console import Console
 from rich.panel import Panel
@@ -19,37 +21,53 @@ def info(package_name: str):
       - Name of an installed package
       - owner/repo format for any GitHub repo
     """
-    manifest = Manifest()
-    package = manifest.get(package_name)
+    # If the argument already names a repo, start fetching its releases
+    # while the manifest is read
+    try:
+        spec = parse_repo_spec(package_name)
+        spec_error = None
+    except ValueError as e:
+        spec = None
+        spec_error = e
 
-    if package:
-        # Show installed package info
-        lines = [
-            f"[bold]Name:[/bold] {package.name}",
-            f"[bold]Repository:[/bold] {package.repo}",
-            f"[bold]Version:[/bold] {package.version}",
-            f"[bold]Tag:[/bold] {package.tag}",
-            f"[bold]Installed:[/bold] {package.installed_at.strftime('%Y-%m-%d %H:%M')}",
-            f"[bold]Binaries:[/bold] {', '.join(package.binaries)}",
-            f"[bold]Asset:[/bold] {package.asset}",
-            f"[bold]Pinned:[/bold] {'Yes' if package.pinned else 'No'}",
-        ]
-        console.print(Panel("\n".join(lines), title=f"[green]{package.name}[/green] (installed)"))
+    with GitHubClient() as client, ThreadPoolExecutor(max_workers=1) as executor:
+        future = None
+        if spec is not None:
+            future = executor.submit(client.get_releases, *spec, per_page=5)
 
-        # Also show available versions
-        owner, repo = package.repo.split("/")
-    else:
-        # Try to parse as repo spec
-        try:
-            owner, repo = parse_repo_spec(package_name)
-        except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
+        manifest = Manifest()
+        package = manifest.get(package_name)
+
+        if package:
+            # Show installed package info
+            lines = [
+                f"[bold]Name:[/bold] {package.name}",
+                f"[bold]Repository:[/bold] {package.repo}",
+                f"[bold]Version:[/bold] {package.version}",
+                f"[bold]Tag:[/bold] {package.tag}",
+                f"[bold]Installed:[/bold] {package.installed_at.isoformat(sep=' ', timespec='minutes')}",
+                f"[bold]Binaries:[/bold] {', '.join(package.binaries)}",
+                f"[bold]Asset:[/bold] {package.asset}",
+                f"[bold]Pinned:[/bold] {'Yes' if package.pinned else 'No'}",
+            ]
+            console.print(Panel("\n".join(lines), title=f"[green]{package.name}[/green] (installed)"))
+
+            # Also show available versions
+            owner, repo = package.repo.split("/")
+        elif spec is not None:
+            owner, repo = spec
+        else:
+            console.print(f"[red]Error:[/red] {spec_error}")
             raise SystemExit(1)
 
-    # Fetch release info from GitHub
-    with GitHubClient() as client:
+        # Fetch release info from GitHub, unless it was already prefetched
+        if future is None or (owner, repo) != spec:
+            if future is not None:
+                future.cancel()
+            future = executor.submit(client.get_releases, owner, repo, per_page=5)
+
         try:
-            releases = client.get_releases(owner, repo, per_page=5)
+            releases = future.result()
         except GitHubError as e:
             console.print(f"[red]Error:[/red] {e}")
             raise SystemExit(1)
@@ -1,11 +1,15 @@
 """Install command implementation."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+import fnmatch
+import hashlib
+import re
+import shutil
 
 import click
 from rich.console import Console
-from rich.prompt import Confirm
 
 from hobbes.core.config import get_config
 from hobbes.core.github import GitHubClient, GitHubError, parse_repo_spec
@@ -14,18 +18,30 @@ from hobbes.core.downloader import download_file, DownloadError
 from hobbes.core.extractor import (
     extract_archive,
     install_binaries,
+    is_binary_candidate,
     find_scripts,
     make_executable,
     cleanup_temp_dir,
     ExtractionError,
 )
-from hobbes.core.checksum import verify_checksum, ChecksumError
+from hobbes.core.checksum import check_checksum, get_expected_checksum, ChecksumError
 from hobbes.core.manifest import Manifest
 from hobbes.models.package import Package
 from hobbes.models.release import Release, Asset
 
 console = Console()
 
+# Maximum number of scripts copied concurrently
+MAX_COPY_WORKERS = 8
+
+
+def install_script(script: Path, bin_dir: Path) -> str:
+    """Copy a script into bin_dir and make it executable. Returns its name."""
+    dest = bin_dir / script.name
+    shutil.copy2(script, dest)
+    make_executable(dest)
+    return script.name
+
 
 def install_from_binary(
     release: Release,
@@ -38,16 +54,20 @@ def install_from_binary(
     """Install from a binary asset. Returns True on success."""
     console.print(f"  Selected asset: [cyan]{asset.name}[/cyan]")
 
-    # Download
-    try:
-        archive_path = download_file(asset.download_url, filename=asset.name)
-    except DownloadError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        return False
+    # Download, hashing as we go, while fetching the expected checksum
+    sha256 = hashlib.sha256()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        expected_future = executor.submit(get_expected_checksum, release.assets, asset)
+        try:
+            archive_path = download_file(asset.download_url, filename=asset.name, hasher=sha256)
+        except DownloadError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            return False
+        expected_sha256 = expected_future.result()
 
     # Verify checksum
     try:
-        verify_checksum(archive_path, release.assets, asset)
+        check_checksum(sha256.hexdigest(), expected_sha256, asset)
         console.print("  [green]✓[/green] Checksum verified")
     except ChecksumError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -57,7 +77,7 @@ def install_from_binary(
     # Extract and install
     temp_dir = None
     try:
-        temp_dir = extract_archive(archive_path)
+        temp_dir = extract_archive(archive_path, predicate=is_binary_candidate)
         binaries = install_binaries(temp_dir)
 
         if not binaries:
@@ -140,6 +160,8 @@ def install_from_source(
             console.print(f"    ... and {len(scripts) - 10} more")
 
         # Prompt for confirmation
+        from rich.prompt import Confirm
+
         console.print("")
         if not Confirm.ask("Install these scripts?", default=True):
             console.print("Installation cancelled")
@@ -149,40 +171,35 @@ def install_from_source(
         bin_dir = config.bin_dir
         bin_dir.mkdir(parents=True, exist_ok=True)
 
+        # For source installs, only install scripts matching repo name
+        # or scripts in the root/bin directory. Skip if deeply nested
+        # (more than 2 levels in extracted dir). Later scripts with the
+        # same name win, as they would if copied one after another.
+        to_install = {
+            script.name: script
+            for script in scripts
+            if len(script.relative_to(temp_dir).parts) <= 3
+        }
+
+        # Copies are independent and syscall-bound, so run them concurrently
         installed = []
-        for script in scripts:
-            # For source installs, only install scripts matching repo name
-            # or scripts in the root/bin directory
-            rel_parts = script.relative_to(temp_dir).parts
-            # Skip if deeply nested (more than 2 levels in extracted dir)
-            if len(rel_parts) > 3:
-                continue
-
-            dest = bin_dir / script.name
-            import shutil
-            shutil.copy2(script, dest)
-            make_executable(dest)
-            installed.append(script.name)
+        if to_install:
+            workers = min(MAX_COPY_WORKERS, len(to_install))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                installed = list(
+                    executor.map(lambda s: install_script(s, bin_dir), to_install.values())
+                )
 
         if not installed:
             # Fall back to installing the first script that matches repo name
             for script in scripts:
                 if script.name.lower() == repo.lower():
-                    dest = bin_dir / script.name
-                    import shutil
-                    shutil.copy2(script, dest)
-                    make_executable(dest)
-                    installed.append(script.name)
+                    installed.append(install_script(script, bin_dir))
                     break
 
             if not installed and scripts:
                 # Just install the first one
-                script = scripts[0]
-                dest = bin_dir / script.name
-                import shutil
-                shutil.copy2(script, dest)
-                make_executable(dest)
-                installed.append(script.name)
+                installed.append(install_script(scripts[0], bin_dir))
 
         if not installed:
             console.print("[red]Error:[/red] No scripts installed")
@@ -218,20 +235,20 @@ def install_from_source(
 
 
 def find_asset_by_name(assets: list[Asset], pattern: str) -> Asset | None:
-    """Find an asset by exact name or glob pattern."""
-    import fnmatch
+    """Find an asset by exact name or glob pattern.
 
-    # Try exact match first
-    for asset in assets:
-        if asset.name == pattern:
-            return asset
+    An exact match wins over an earlier glob match.
+    """
+    regex = re.compile(fnmatch.translate(pattern.lower()))
 
-    # Try glob pattern match
+    glob_match = None
     for asset in assets:
-        if fnmatch.fnmatch(asset.name.lower(), pattern.lower()):
+        if asset.name == pattern:
             return asset
+        if glob_match is None and regex.match(asset.name_lower):
+            glob_match = asset
 
-    return None
+    return glob_match
 
 
 @click.command()
@@ -264,8 +281,8 @@ def install(repo_spec: str, version_tag: str | None, force: bool, source: bool,
     manifest = Manifest()
 
     # Check if already installed
-    if manifest.has(repo) and not force:
-        pkg = manifest.get(repo)
+    pkg = manifest.get(repo)
+    if pkg is not None and not force:
         console.print(
             f"[yellow]{repo}[/yellow] is already installed (version {pkg.version}). "
             f"Use --force to reinstall."
@@ -293,9 +310,10 @@ def install(repo_spec: str, version_tag: str | None, force: bool, source: bool,
                 console.print("\n[yellow]No assets in this release[/yellow]")
             else:
                 console.print(f"\n[bold]Available assets ({len(release.assets)}):[/bold]")
-                for a in release.assets:
-                    size_mb = a.size / (1024 * 1024)
-                    console.print(f"  [cyan]{a.name}[/cyan] ({size_mb:.1f} MB)")
+                console.print("\n".join(
+                    f"  [cyan]{a.name}[/cyan] ({a.size / (1024 * 1024):.1f} MB)"
+                    for a in release.assets
+                ))
             raise SystemExit(0)
 
         # If --source flag, skip binary search
@@ -311,8 +329,7 @@ def install(repo_spec: str, version_tag: str | None, force: bool, source: bool,
             if asset is None:
                 console.print(f"[red]Error:[/red] No asset matching '{asset_pattern}'")
                 console.print("\nAvailable assets:")
-                for a in release.assets:
-                    console.print(f"  - {a.name}")
+                console.print("\n".join(f"  - {a.name}" for a in release.assets))
                 raise SystemExit(1)
 
             if install_from_binary(release, asset, owner, repo, manifest, config):
@@ -335,9 +352,10 @@ def install(repo_spec: str, version_tag: str | None, force: bool, source: bool,
         elif len(matching_assets) > 1:
             # Multiple equally-good matches, prompt user to choose
             console.print(f"\n[yellow]Multiple compatible assets found:[/yellow]")
-            for i, a in enumerate(matching_assets, 1):
-                size_mb = a.size / (1024 * 1024)
-                console.print(f"  {i}. [cyan]{a.name}[/cyan] ({size_mb:.1f} MB)")
+            console.print("\n".join(
+                f"  {i}. [cyan]{a.name}[/cyan] ({a.size / (1024 * 1024):.1f} MB)"
+                for i, a in enumerate(matching_assets, 1)
+            ))
 
             console.print("")
             while True:
@@ -361,13 +379,14 @@ def install(repo_spec: str, version_tag: str | None, force: bool, source: bool,
                 f"[yellow]No compatible binary found for {platform_info.os}/{platform_info.arch}[/yellow]"
             )
             console.print("Available assets:")
-            for a in release.assets:
-                console.print(f"  - {a.name}")
+            console.print("\n".join(f"  - {a.name}" for a in release.assets))
             console.print("\n[dim]Tip: Use --asset <name> to install a specific asset[/dim]")
         else:
             console.print("[yellow]This release has no binary assets[/yellow]")
 
         # Prompt for source install
+        from rich.prompt import Confirm
+
         console.print("")
         if Confirm.ask("Try installing from source?", default=True):
             if install_from_source(release, owner, repo, manifest, config):
@@ -1,5 +1,7 @@
 """List command implementation."""
 
+from operator import attrgetter
+
 import click
 from rich.console import Console
 from rich.table import Table
@@ -28,15 +30,18 @@ def list_packages():
     table.add_column("Binaries")
     table.add_column("Pinned")
 
-    for pkg in sorted(packages, key=lambda p: p.name):
-        pinned = "📌" if pkg.pinned else ""
-        table.add_row(
+    rows = [
+        (
             pkg.name,
             pkg.version,
             pkg.repo,
             pkg.asset or "(source)",
             ", ".join(pkg.binaries),
-            pinned,
+            "📌" if pkg.pinned else "",
         )
+        for pkg in sorted(packages, key=attrgetter("name"))
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
@@ -5,7 +5,7 @@ from rich.console import Console
 from rich.table import Table
 
 from hobbes.core.manifest import Manifest
-from hobbes.core.github import GitHubClient, GitHubError
+from hobbes.core.github import GitHubClient
 
 console = Console()
 
@@ -25,20 +25,22 @@ def outdated():
     outdated_packages = []
 
     with GitHubClient() as client:
-        for package in packages:
-            owner, repo = package.repo.split("/")
-            try:
-                release = client.get_latest_release(owner, repo)
-                if release.version != package.version:
-                    outdated_packages.append({
-                        "name": package.name,
-                        "current": package.version,
-                        "latest": release.version,
-                        "pinned": package.pinned,
-                    })
-            except GitHubError:
-                # Skip packages we can't check
-                pass
+        releases = client.get_latest_releases(
+            [tuple(package.repo.split("/")) for package in packages]
+        )
+
+    for package in packages:
+        release = releases.get(tuple(package.repo.split("/")))
+        if release is None:
+            # Skip packages we can't check
+            continue
+        if release.version != package.version:
+            outdated_packages.append({
+                "name": package.name,
+                "current": package.version,
+                "latest": release.version,
+                "pinned": package.pinned,
+            })
 
     if not outdated_packages:
         console.print("[green]All packages are up to date![/green]")
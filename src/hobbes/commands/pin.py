@@ -17,11 +17,11 @@ def pin(package_name: str):
     """
     manifest = Manifest()
 
-    if not manifest.has(package_name):
+    package = manifest.get(package_name)
+    if package is None:
         console.print(f"[red]Error:[/red] Package '{package_name}' is not installed")
         raise SystemExit(1)
 
-    package = manifest.get(package_name)
     if package.pinned:
         console.print(f"[yellow]{package_name}[/yellow] is already pinned to {package.version}")
         raise SystemExit(0)
@@ -36,11 +36,11 @@ def unpin(package_name: str):
     """Unpin a package, allowing it to be upgraded."""
     manifest = Manifest()
 
-    if not manifest.has(package_name):
+    package = manifest.get(package_name)
+    if package is None:
         console.print(f"[red]Error:[/red] Package '{package_name}' is not installed")
         raise SystemExit(1)
 
-    package = manifest.get(package_name)
     if not package.pinned:
         console.print(f"[yellow]{package_name}[/yellow] is not pinned")
         raise SystemExit(0)
@@ -16,7 +16,12 @@ HOBBES_REPO = "mmasters/hobbes"
 
 @click.command("self-update")
 @click.option("--force", "-f", is_flag=True, help="Force update even if up to date")
-def self_update(force: bool):
+@click.option(
+    "--deep",
+    is_flag=True,
+    help="Also resolve and upgrade dependencies (use if the new version needs new ones)",
+)
+def self_update(force: bool, deep: bool):
     """Update hobbes itself to the latest version."""
     console.print(f"[blue]Current version:[/blue] {__version__}")
 
@@ -38,20 +43,23 @@ def self_update(force: bool):
     console.print(f"\n[blue]Updating hobbes...[/blue]")
 
     # Determine how to update based on how hobbes was installed
-    # Try pip upgrade from git
+    # Try pip upgrade from git. Skip dependency resolution unless asked: it
+    # dominates pip's run time and the dependencies rarely change
+    args = [
+        sys.executable,
+        "-m",
+        "pip",
+        "install",
+        "--upgrade",
+        "--disable-pip-version-check",
+    ]
+    if not deep:
+        args.append("--no-deps")
+    args.append(f"git+https://github.com/{HOBBES_REPO}.git")
+
     try:
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "--upgrade",
-                f"git+https://github.com/{HOBBES_REPO}.git",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        # Let pip's output through so progress is visible
+        result = subprocess.run(args)
 
         if result.returncode == 0:
             if latest_version:
@@ -60,7 +68,7 @@ def self_update(force: bool):
                 console.print("\n[green]✓[/green] Updated to latest")
             console.print("[dim]Restart hobbes to use the new version[/dim]")
         else:
-            console.print(f"[red]Error updating:[/red] {result.stderr}")
+            console.print(f"[red]Error updating:[/red] pip exited with status {result.returncode}")
             raise SystemExit(1)
 
     except Exception as e:
@@ -1,32 +1,43 @@
 """Update command implementation."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
 
 import click
 from rich.console import Console
 
 from hobbes.core.config import get_config
-from hobbes.core.github import GitHubClient, GitHubError
-from hobbes.core.platform import find_best_asset, get_platform_info
+from hobbes.core.github import GitHubClient, GitHubError, MAX_WORKERS
+from hobbes.core.platform import PlatformInfo, find_best_asset, get_platform_info
 from hobbes.core.downloader import download_file, DownloadError
 from hobbes.core.extractor import (
     extract_archive,
     install_binaries,
+    is_binary_candidate,
     uninstall_binaries,
     cleanup_temp_dir,
     ExtractionError,
 )
-from hobbes.core.checksum import verify_checksum, ChecksumError
+from hobbes.core.checksum import check_checksum, get_expected_checksum, ChecksumError
 from hobbes.core.manifest import Manifest
 from hobbes.models.package import Package
+from hobbes.models.release import Release
 
 console = Console()
 
 
-def update_package(package: Package, manifest: Manifest, force: bool = False) -> bool:
-    """Update a single package. Returns True if updated."""
+def skip_pinned(package: Package, force: bool = False) -> bool:
+    """Report and return True if a package is pinned and should be skipped."""
     if package.pinned and not force:
         console.print(f"  [yellow]{package.name}[/yellow] is pinned, skipping")
+        return True
+    return False
+
+
+def update_package(package: Package, manifest: Manifest, force: bool = False) -> bool:
+    """Update a single package. Returns True if updated."""
+    if skip_pinned(package, force):
         return False
 
     owner, repo = package.repo.split("/")
@@ -38,71 +49,91 @@ def update_package(package: Package, manifest: Manifest, force: bool = False) ->
             console.print(f"  [red]Error fetching {package.name}:[/red] {e}")
             return False
 
-        if release.version == package.version and not force:
-            console.print(f"  [green]{package.name}[/green] is up to date ({package.version})")
-            return False
+    return apply_update(package, release, manifest, force)
+
+
+def apply_update(
+    package: Package,
+    release: Release,
+    manifest: Manifest,
+    force: bool = False,
+    platform_info: PlatformInfo | None = None,
+) -> bool:
+    """Install release over a package if it is newer. Returns True if updated.
+
+    Callers updating many packages can pass platform_info to detect the
+    platform once up front.
+    """
+    if release.version == package.version and not force:
+        console.print(f"  [green]{package.name}[/green] is up to date ({package.version})")
+        return False
 
-        console.print(
-            f"  [blue]Updating[/blue] {package.name}: {package.version} → {release.version}"
-        )
+    console.print(
+        f"  [blue]Updating[/blue] {package.name}: {package.version} → {release.version}"
+    )
 
+    if platform_info is None:
         platform_info = get_platform_info()
-        asset = find_best_asset(release.assets, platform_info)
-        if asset is None:
-            console.print(f"    [red]No compatible binary found[/red]")
-            return False
+    asset = find_best_asset(release.assets, platform_info)
+    if asset is None:
+        console.print(f"    [red]No compatible binary found[/red]")
+        return False
 
-        # Download
+    # Download, hashing as we go, while fetching the expected checksum
+    sha256 = hashlib.sha256()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        expected_future = executor.submit(get_expected_checksum, release.assets, asset)
         try:
-            archive_path = download_file(asset.download_url, filename=asset.name)
+            archive_path = download_file(asset.download_url, filename=asset.name, hasher=sha256)
         except DownloadError as e:
             console.print(f"    [red]Download failed:[/red] {e}")
             return False
+        expected_sha256 = expected_future.result()
+
+    # Verify checksum
+    try:
+        check_checksum(sha256.hexdigest(), expected_sha256, asset)
+    except ChecksumError as e:
+        console.print(f"    [red]Checksum failed:[/red] {e}")
+        archive_path.unlink(missing_ok=True)
+        return False
 
-        # Verify checksum
-        try:
-            verify_checksum(archive_path, release.assets, asset)
-        except ChecksumError as e:
-            console.print(f"    [red]Checksum failed:[/red] {e}")
-            archive_path.unlink(missing_ok=True)
-            return False
-
-        # Remove old binaries
-        uninstall_binaries(package.binaries)
+    # Remove old binaries
+    uninstall_binaries(package.binaries)
 
-        # Extract and install new
-        temp_dir = None
-        try:
-            temp_dir = extract_archive(archive_path)
-            binaries = install_binaries(temp_dir)
+    # Extract and install new
+    temp_dir = None
+    try:
+        temp_dir = extract_archive(archive_path, predicate=is_binary_candidate)
+        binaries = install_binaries(temp_dir)
 
-            if not binaries:
-                console.print("    [red]No binaries found[/red]")
-                return False
-
-        except ExtractionError as e:
-            console.print(f"    [red]Extraction failed:[/red] {e}")
+        if not binaries:
+            console.print("    [red]No binaries found[/red]")
             return False
-        finally:
-            if temp_dir:
-                cleanup_temp_dir(temp_dir)
-            archive_path.unlink(missing_ok=True)
-
-        # Update manifest
-        updated_package = Package(
-            name=package.name,
-            repo=package.repo,
-            version=release.version,
-            tag=release.tag_name,
-            installed_at=datetime.now(),
-            binaries=binaries,
-            pinned=package.pinned,
-            asset=asset.name,
-        )
-        manifest.add(updated_package)
-
-        console.print(f"    [green]✓[/green] Updated to {release.version}")
-        return True
+
+    except ExtractionError as e:
+        console.print(f"    [red]Extraction failed:[/red] {e}")
+        return False
+    finally:
+        if temp_dir:
+            cleanup_temp_dir(temp_dir)
+        archive_path.unlink(missing_ok=True)
+
+    # Update manifest
+    updated_package = Package(
+        name=package.name,
+        repo=package.repo,
+        version=release.version,
+        tag=release.tag_name,
+        installed_at=datetime.now(),
+        binaries=binaries,
+        pinned=package.pinned,
+        asset=asset.name,
+    )
+    manifest.add(updated_package)
+
+    console.print(f"    [green]✓[/green] Updated to {release.version}")
+    return True
 
 
 @click.command()
@@ -146,9 +177,34 @@ def upgrade_all(force: bool):
 
     console.print(f"[blue]Checking {len(packages)} packages for updates...[/blue]\n")
 
+    to_check = [package for package in packages if force or not package.pinned]
+    platform_info = get_platform_info()
+
     updated_count = 0
-    for package in packages:
-        if update_package(package, manifest, force):
-            updated_count += 1
+    with GitHubClient() as client:
+        # Release lookups are network-bound, so run them concurrently. Updates
+        # are applied one at a time, in manifest order, as results come in.
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(to_check)))) as executor:
+            futures = {
+                package.name: executor.submit(
+                    client.get_latest_release, *package.repo.split("/")
+                )
+                for package in to_check
+            }
+
+            # Write the manifest once at the end rather than per update
+            with manifest.defer_save():
+                for package in packages:
+                    if skip_pinned(package, force):
+                        continue
+
+                    try:
+                        release = futures[package.name].result()
+                    except GitHubError as e:
+                        console.print(f"  [red]Error fetching {package.name}:[/red] {e}")
+                        continue
+
+                    if apply_update(package, release, manifest, force, platform_info):
+                        updated_count += 1
 
     console.print(f"\n[green]✓[/green] Updated {updated_count} package(s)")
@@ -0,0 +1,160 @@
+"""On-disk cache of GitHub API responses."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from hobbes.core.config import get_config, replacement_mode
+
+
+CACHE_FILENAME = "github_cache.json"
+
+# Entries older than this are refetched unconditionally instead of revalidated
+MAX_AGE = 3600
+
+# Negative entries (404s and empty results) are reused without a request for
+# this long, then refetched
+NEGATIVE_TTL = 60
+
+# Most entries kept on save; the least recently fetched are dropped beyond this
+MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """Caches GitHub API response bodies with their ETag/Last-Modified validators.
+
+    Entries are keyed by request URL. Callers revalidate cached entries with a
+    conditional request and reuse the cached body on a 304 response.
+
+    Negative entries record a 404 or empty result. They are returned by get()
+    only while younger than NEGATIVE_TTL, and callers use them without making
+    a request at all.
+
+    The file is read on first use, so clients that never touch the cache
+    don't pay for parsing it. Expired entries are dropped when saving, and at
+    most MAX_ENTRIES are kept.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_config().cache_dir / CACHE_FILENAME
+        self._entries: dict[str, dict] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> dict[str, dict]:
+        """Load cache entries on first access. Call with the lock held."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> dict[str, dict]:
+        """Read cache entries from file, ignoring a missing or corrupt cache."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _is_expired(entry: dict, now: float) -> bool:
+        """Check if an entry has outlived its TTL."""
+        max_age = NEGATIVE_TTL if entry.get("negative") else MAX_AGE
+        return now - entry.get("timestamp", 0) > max_age
+
+    def _prune(self) -> None:
+        """Drop expired entries, then the oldest beyond MAX_ENTRIES.
+
+        Call with the lock held.
+        """
+        now = time.time()
+        entries = {
+            url: entry
+            for url, entry in self._entries.items()
+            if not self._is_expired(entry, now)
+        }
+        if len(entries) > MAX_ENTRIES:
+            newest = sorted(
+                entries.items(), key=lambda item: item[1].get("timestamp", 0), reverse=True
+            )
+            entries = dict(newest[:MAX_ENTRIES])
+        if len(entries) != len(self._entries):
+            self._entries = entries
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it has changed."""
+        with self._lock:
+            if self._entries is None:
+                return  # Never loaded, so nothing changed
+            self._prune()
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries)
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".github_cache")
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.chmod(tmp_path, replacement_mode(self.path))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Caching is best-effort
+            pass
+
+    def get(self, url: str) -> dict | None:
+        """Get the cache entry for a URL, or None if missing or expired."""
+        with self._lock:
+            entries = self._ensure_loaded()
+            entry = entries.get(url)
+            if entry is None:
+                return None
+            if self._is_expired(entry, time.time()):
+                del entries[url]
+                self._dirty = True
+                return None
+            return entry
+
+    def put(
+        self,
+        url: str,
+        body: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body and its validators."""
+        with self._lock:
+            self._ensure_loaded()[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+                "timestamp": time.time(),
+            }
+            self._dirty = True
+
+    def put_negative(self, url: str, status: int, body: Any = None) -> None:
+        """Store a short-lived negative result (e.g. a 404 or an empty list)."""
+        with self._lock:
+            self._ensure_loaded()[url] = {
+                "negative": True,
+                "status": status,
+                "body": body,
+                "timestamp": time.time(),
+            }
+            self._dirty = True
+
+    def conditional_headers(self, entry: dict) -> dict[str, str]:
+        """Build conditional request headers for a cache entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
@@ -1,8 +1,6 @@
 """Checksum verification for downloaded files."""
 
-import hashlib
 import re
-from pathlib import Path
 
 from hobbes.core.downloader import download_text
 from hobbes.models.release import Asset
@@ -14,35 +12,32 @@ class ChecksumError(Exception):
     pass
 
 
-def calculate_sha256(file_path: Path) -> str:
-    """Calculate SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+# Checksum file line formats: "<hash>  <filename>" / "<hash> *<filename>",
+# and "<filename>: <hash>"
+HASH_FILENAME_RE = re.compile(r"([a-fA-F0-9]{64})\s+\*?(.+)")
+FILENAME_HASH_RE = re.compile(r"(.+?):\s*([a-fA-F0-9]{64})")
 
 
 def find_checksum_asset(assets: list[Asset], target_asset: Asset) -> Asset | None:
-    """Find a checksum file asset for the target asset."""
-    target_name = target_asset.name.lower()
-
-    # Common checksum file patterns
-    checksum_patterns = [
-        "sha256sums",
-        "sha256",
-        "checksums",
-        "checksums.txt",
-        f"{target_asset.name}.sha256",
-        f"{target_asset.name}.sha256sum",
-    ]
+    """Find a checksum file asset for the target asset.
 
+    A checksum file named exactly <asset>.sha256 or <asset>.sha256sum is
+    preferred over shared ones like SHA256SUMS or checksums.txt.
+    """
+    target_name = target_asset.name_lower
+    own_names = (target_name + ".sha256", target_name + ".sha256sum")
+
+    first_match = None
     for asset in assets:
-        name = asset.name.lower()
-        if any(pattern in name for pattern in checksum_patterns):
-            return asset
+        name = asset.name_lower
+        # Covers sha256sums, <asset>.sha256, <asset>.sha256sum, checksums.txt
+        if "sha256" in name or "checksums" in name:
+            if name in own_names:
+                return asset
+            if first_match is None:
+                first_match = asset
 
-    return None
+    return first_match
 
 
 def parse_checksum_file(content: str, target_filename: str) -> str | None:
@@ -61,14 +56,15 @@ def parse_checksum_file(content: str, target_filename: str) -> str | None:
             continue
 
         # Format: hash  filename or hash *filename
-        match = re.match(r"([a-fA-F0-9]{64})\s+\*?(.+)", line)
+        match = HASH_FILENAME_RE.match(line)
         if match:
             hash_value, filename = match.groups()
             if filename.lower() == target_filename_lower:
                 return hash_value.lower()
+            continue
 
         # Format: filename: hash
-        match = re.match(r"(.+?):\s*([a-fA-F0-9]{64})", line)
+        match = FILENAME_HASH_RE.match(line) if ":" in line else None
         if match:
             filename, hash_value = match.groups()
             if filename.lower() == target_filename_lower:
@@ -77,33 +73,37 @@ def parse_checksum_file(content: str, target_filename: str) -> str | None:
     return None
 
 
-def verify_checksum(
-    file_path: Path,
-    assets: list[Asset],
-    target_asset: Asset,
-) -> bool:
-    """Verify checksum of downloaded file if checksum is available.
-
-    Returns True if:
-    - Checksum matches
-    - No checksum file is available (skip verification)
+def get_expected_checksum(assets: list[Asset], target_asset: Asset) -> str | None:
+    """Download the release's checksum file and find the hash for target_asset.
 
-    Raises ChecksumError if checksum doesn't match.
+    Returns None if no checksum is available (no checksum file, download
+    failed, or no entry for the asset).
     """
     checksum_asset = find_checksum_asset(assets, target_asset)
     if checksum_asset is None:
-        return True  # No checksum available, skip
+        return None  # No checksum available
 
     # Download checksum file
     checksum_content = download_text(checksum_asset.download_url)
     if checksum_content is None:
-        return True  # Couldn't download, skip
+        return None  # Couldn't download
 
-    expected_hash = parse_checksum_file(checksum_content, target_asset.name)
-    if expected_hash is None:
-        return True  # Couldn't find hash for our file, skip
+    return parse_checksum_file(checksum_content, target_asset.name)
 
-    actual_hash = calculate_sha256(file_path)
+
+def check_checksum(
+    actual_hash: str,
+    expected_hash: str | None,
+    target_asset: Asset,
+) -> bool:
+    """Compare a file's SHA256 against the expected hash.
+
+    Returns True if they match, or if there is no expected hash.
+
+    Raises ChecksumError if checksum doesn't match.
+    """
+    if expected_hash is None:
+        return True  # Nothing to verify against, skip
 
     if actual_hash != expected_hash:
         raise ChecksumError(
@@ -3,6 +3,7 @@
 from pathlib import Path
 from dataclasses import dataclass
 import os
+import stat
 
 
 @dataclass
@@ -44,6 +45,21 @@ def get_config() -> HobbesConfig:
     return _config
 
 
+def replacement_mode(path: Path) -> int:
+    """Get the permission bits for a file written to replace path.
+
+    Keeps path's current mode, or uses the umask default (as open() would)
+    if path doesn't exist yet. Used for atomic writes, since mkstemp creates
+    its temp file with mode 0600.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
 def set_config(config: HobbesConfig) -> None:
     """Set a custom configuration (useful for testing)."""
     global _config
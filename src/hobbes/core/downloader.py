@@ -1,6 +1,11 @@
 """Download functionality with progress reporting."""
 
 from pathlib import Path
+import atexit
+import hashlib
+import importlib.util
+import threading
+import time
 import httpx
 from rich.progress import (
     Progress,
@@ -10,20 +15,51 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
+from hobbes import __version__
 from hobbes.core.config import get_config
 
 
+# Size of each chunk pulled off the response stream, written to disk and fed
+# to the hasher
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Minimum seconds between progress bar updates
+PROGRESS_INTERVAL = 1 / 30
+
+
 class DownloadError(Exception):
     """Error during download."""
 
     pass
 
 
+# Shared client so consecutive downloads (e.g. an asset and its checksum
+# file, both on GitHub's CDN) reuse connections instead of new TLS handshakes
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared download client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                headers={"User-Agent": f"hobbes/{__version__}"},
+                follow_redirects=True,
+                timeout=60.0,
+                http2=importlib.util.find_spec("h2") is not None,
+            )
+            atexit.register(_client.close)
+        return _client
+
+
 def download_file(
     url: str,
     dest: Path | None = None,
     filename: str | None = None,
     show_progress: bool = True,
+    hasher: "hashlib._Hash | None" = None,
 ) -> Path:
     """Download a file from URL.
 
@@ -32,6 +68,8 @@ def download_file(
         dest: Destination directory (defaults to cache dir)
         filename: Filename to save as (defaults to URL filename)
         show_progress: Whether to show progress bar
+        hasher: Optional hashlib object updated with each chunk as it is
+            written, so the file doesn't need to be re-read to hash it
 
     Returns:
         Path to downloaded file
@@ -45,7 +83,7 @@ def download_file(
 
     file_path = dest / filename
 
-    with httpx.stream("GET", url, follow_redirects=True, timeout=60.0) as response:
+    with _get_client().stream("GET", url) as response:
         if response.status_code != 200:
             raise DownloadError(
                 f"Failed to download {url}: HTTP {response.status_code}"
@@ -63,14 +101,30 @@ def download_file(
             ) as progress:
                 task = progress.add_task(f"Downloading {filename}", total=total)
 
+                # Coalesce progress updates so rendering doesn't dominate on
+                # fast links
+                pending = 0
+                last_update = time.monotonic()
+
                 with open(file_path, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=8192):
+                    for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
-                        progress.update(task, advance=len(chunk))
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        pending += len(chunk)
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_INTERVAL:
+                            progress.update(task, advance=pending)
+                            pending = 0
+                            last_update = now
+
+                progress.update(task, advance=pending)
         else:
             with open(file_path, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=8192):
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
 
     return file_path
 
@@ -81,7 +135,7 @@ def download_text(url: str) -> str | None:
     Returns None if download fails.
     """
     try:
-        response = httpx.get(url, follow_redirects=True, timeout=30.0)
+        response = _get_client().get(url, timeout=30.0)
         if response.status_code == 200:
             return response.text
     except httpx.HTTPError:
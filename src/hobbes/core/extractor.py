@@ -1,6 +1,7 @@
 """Archive extraction and binary installation."""
 
 from pathlib import Path
+from typing import Callable, Iterator, Literal
 import tarfile
 import zipfile
 import gzip
@@ -11,6 +12,15 @@ import tempfile
 
 from hobbes.core.config import get_config
 
+# isal's igzip is a drop-in gzip that decompresses several times faster
+try:
+    from isal import igzip
+except ImportError:
+    igzip = gzip
+
+# Buffer size for copying decompressed single-file archives
+COPY_BUFFER_SIZE = 1 << 20
+
 
 class ExtractionError(Exception):
     """Error during extraction."""
@@ -18,50 +28,133 @@ class ExtractionError(Exception):
     pass
 
 
+# Archive members with these extensions are never installed as binaries
+NON_BINARY_EXTENSIONS = {
+    ".md", ".txt", ".rst", ".html", ".pdf",
+    ".json", ".yaml", ".yml", ".toml",
+    ".png", ".jpg", ".jpeg", ".gif", ".svg",
+}
+
+# Man page sections. Versioned executables end the same way (python3.8,
+# lua5.1), so these only count under a man/ directory.
+MAN_PAGE_EXTENSIONS = {".1", ".5", ".7", ".8"}
+
+ArchiveMember = tarfile.TarInfo | zipfile.ZipInfo
+
+
+# Leading bytes of executable binaries
+BINARY_SIGNATURES = {
+    b"\x7fELF",  # ELF
+    b"\xfe\xed\xfa\xce",  # Mach-O 32-bit
+    b"\xfe\xed\xfa\xcf",  # Mach-O 64-bit
+    b"\xca\xfe\xba\xbe",  # Mach-O universal
+    b"\xcf\xfa\xed\xfe",  # Mach-O 64-bit reversed
+    b"\xce\xfa\xed\xfe",  # Mach-O 32-bit reversed
+}
+
+
+def is_binary_candidate(member: ArchiveMember) -> bool:
+    """Check if an archive member could be a binary.
+
+    Used to skip extracting docs, man pages and other data files. Directories,
+    links and members with an exec bit are always kept; anything that passes
+    is still checked with is_executable after extraction.
+    """
+    if isinstance(member, zipfile.ZipInfo):
+        name = member.filename
+        mode = member.external_attr >> 16
+        if member.is_dir() or stat.S_ISLNK(mode) or mode & 0o111:
+            return True
+    else:
+        name = member.name
+        if not member.isfile() or member.mode & 0o111:
+            return True
+
+    parts = name.rstrip("/").lower().split("/")
+    base = parts[-1]
+    dot = base.rfind(".")
+    if dot <= 0:
+        return True
+
+    extension = base[dot:]
+    if extension in MAN_PAGE_EXTENSIONS:
+        return "man" not in parts[:-1]
+    return extension not in NON_BINARY_EXTENSIONS
+
+
+def _walk_files(
+    directory: Path | str,
+    exclude_dirs: set[str] | frozenset[str] = frozenset(),
+) -> Iterator[os.DirEntry]:
+    """Recursively yield entries for regular files under directory.
+
+    Uses os.scandir so file-type checks come from the directory listing
+    instead of a separate stat per entry. Symlinked directories are not
+    followed, matching Path.rglob. Subdirectories whose lowercased name is
+    in exclude_dirs are pruned without being descended into.
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.lower() not in exclude_dirs:
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+
+    for subdir in subdirs:
+        yield from _walk_files(subdir, exclude_dirs)
+
+
 def is_executable(path: Path) -> bool:
     """Check if a file is likely an executable binary."""
     if not path.is_file():
         return False
+    return _is_executable_file(path)
 
+
+def _is_executable_file(path: Path) -> bool:
+    """Check if a path already known to be a regular file is executable."""
     # Check if it's already marked executable
     if os.access(path, os.X_OK):
         return True
 
-    # Check for common binary signatures
+    # Check for common binary signatures (or a shebang)
+    return classify_file(path) != "other"
+
+
+def classify_file(path: Path | str) -> Literal["binary", "script", "other"]:
+    """Classify a file by its first bytes.
+
+    Returns "binary" for ELF, Mach-O and PE executables, "script" for files
+    starting with a shebang, and "other" otherwise (or if unreadable).
+    """
     try:
-        with open(path, "rb") as f:
-            header = f.read(4)
-            # ELF binary
-            if header[:4] == b"\x7fELF":
-                return True
-            # Mach-O binary (macOS)
-            if header[:4] in (
-                b"\xfe\xed\xfa\xce",  # 32-bit
-                b"\xfe\xed\xfa\xcf",  # 64-bit
-                b"\xca\xfe\xba\xbe",  # Universal
-                b"\xcf\xfa\xed\xfe",  # 64-bit reversed
-                b"\xce\xfa\xed\xfe",  # 32-bit reversed
-            ):
-                return True
-            # Windows PE
-            if header[:2] == b"MZ":
-                return True
-            # Shell script
-            if header[:2] == b"#!":
-                return True
-    except (IOError, OSError):
-        pass
-
-    return False
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return "other"
+    try:
+        header = os.read(fd, 4)
+    except OSError:
+        return "other"
+    finally:
+        os.close(fd)
+
+    if header[:2] == b"#!":
+        return "script"
+    if header in BINARY_SIGNATURES or header[:2] == b"MZ":  # MZ: Windows PE
+        return "binary"
+    return "other"
 
 
 def find_executables(directory: Path) -> list[Path]:
     """Find all executable files in a directory."""
     executables = []
 
-    for item in directory.rglob("*"):
-        if item.is_file() and is_executable(item):
-            executables.append(item)
+    for entry in _walk_files(directory):
+        path = Path(entry.path)
+        if _is_executable_file(path):
+            executables.append(path)
 
     return executables
 
@@ -70,13 +163,12 @@ def is_script(path: Path) -> bool:
     """Check if a file is an executable script (has shebang)."""
     if not path.is_file():
         return False
+    return _has_shebang(path)
 
-    try:
-        with open(path, "rb") as f:
-            header = f.read(2)
-            return header == b"#!"
-    except (IOError, OSError):
-        return False
+
+def _has_shebang(path: Path) -> bool:
+    """Check if a path already known to be a regular file starts with a shebang."""
+    return classify_file(path) == "script"
 
 
 def find_scripts(directory: Path, repo_name: str | None = None) -> list[Path]:
@@ -94,20 +186,19 @@ def find_scripts(directory: Path, repo_name: str | None = None) -> list[Path]:
 
     scripts = []
 
-    for item in directory.rglob("*"):
-        if not item.is_file():
-            continue
-
-        # Skip files in excluded directories
-        if any(part.lower() in exclude_patterns for part in item.parts):
+    # Excluded directories are pruned by the walk itself. Cheap name checks
+    # run on the DirEntry; only files that pass are probed and wrapped in Path.
+    for entry in _walk_files(directory, exclude_patterns):
+        name = entry.name.lower()
+        if name in exclude_patterns:
             continue
 
         # Skip files with excluded extensions
-        if item.suffix.lower() in exclude_extensions:
+        if os.path.splitext(name)[1] in exclude_extensions:
             continue
 
-        if is_script(item):
-            scripts.append(item)
+        if classify_file(entry.path) == "script":
+            scripts.append(Path(entry.path))
 
     # Sort: prioritize scripts matching repo name, then by path depth (shallower first)
     def sort_key(p: Path) -> tuple[int, int, str]:
@@ -125,13 +216,27 @@ def make_executable(path: Path) -> None:
     path.chmod(current | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
 
-def extract_archive(archive_path: Path, dest_dir: Path | None = None) -> Path:
-    """Extract an archive to a temporary directory.
+def extract_archive(
+    archive_path: Path,
+    dest_dir: Path | None = None,
+    predicate: Callable[[ArchiveMember], bool] | None = None,
+) -> Path:
+    """Extract an archive to a temporary directory (in the cache dir by default).
+
+    If predicate is given, only the archive members (TarInfo or ZipInfo) it
+    accepts are extracted. Tarballs are read in a single streaming pass where
+    possible.
 
-    Returns the directory containing extracted files.
+    Returns the directory containing extracted files. If extraction fails, a
+    directory created here is removed again.
     """
+    created_dest_dir = dest_dir is None
     if dest_dir is None:
-        dest_dir = Path(tempfile.mkdtemp(prefix="hobbes_"))
+        # Extract under HOBBES_HOME rather than $TMPDIR, so installing into
+        # bin_dir can be a rename instead of a copy
+        cache_dir = get_config().cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        dest_dir = Path(tempfile.mkdtemp(prefix="hobbes_", dir=cache_dir))
     else:
         dest_dir.mkdir(parents=True, exist_ok=True)
 
@@ -139,28 +244,28 @@ def extract_archive(archive_path: Path, dest_dir: Path | None = None) -> Path:
 
     try:
         if name.endswith(".tar.gz") or name.endswith(".tgz"):
-            with tarfile.open(archive_path, "r:gz") as tar:
-                tar.extractall(dest_dir, filter="data")
+            _extract_tar(archive_path, dest_dir, "gz", predicate)
 
         elif name.endswith(".tar.xz"):
-            with tarfile.open(archive_path, "r:xz") as tar:
-                tar.extractall(dest_dir, filter="data")
+            _extract_tar(archive_path, dest_dir, "xz", predicate)
 
         elif name.endswith(".tar"):
-            with tarfile.open(archive_path, "r:") as tar:
-                tar.extractall(dest_dir, filter="data")
+            _extract_tar(archive_path, dest_dir, "", predicate)
 
         elif name.endswith(".zip"):
             with zipfile.ZipFile(archive_path, "r") as zf:
-                zf.extractall(dest_dir)
+                members = None
+                if predicate is not None:
+                    members = [m for m in zf.infolist() if predicate(m)]
+                zf.extractall(dest_dir, members=members)
 
         elif name.endswith(".gz"):
             # Single gzipped file
-            output_name = archive_path.stem  # Remove .gz
+            output_name = archive_path.name[:-3]  # Remove .gz
             output_path = dest_dir / output_name
-            with gzip.open(archive_path, "rb") as gz:
+            with igzip.open(archive_path, "rb") as gz:
                 with open(output_path, "wb") as out:
-                    shutil.copyfileobj(gz, out)
+                    shutil.copyfileobj(gz, out, COPY_BUFFER_SIZE)
 
         else:
             # Assume raw binary - just copy it
@@ -168,17 +273,70 @@ def extract_archive(archive_path: Path, dest_dir: Path | None = None) -> Path:
             shutil.copy2(archive_path, output_path)
 
     except (tarfile.TarError, zipfile.BadZipFile, gzip.BadGzipFile, OSError) as e:
+        # The cache dir isn't cleaned by the OS the way $TMPDIR is, and
+        # callers only get the path back on success
+        if created_dest_dir:
+            shutil.rmtree(dest_dir, ignore_errors=True)
         raise ExtractionError(f"Failed to extract {archive_path}: {e}")
 
     return dest_dir
 
 
+def _extract_tar(
+    archive_path: Path,
+    dest_dir: Path,
+    compression: str,
+    predicate: Callable[[ArchiveMember], bool] | None,
+) -> None:
+    """Extract a tarball, in a single sequential pass where possible.
+
+    Streaming mode reads the archive front to back without seeking, and
+    members rejected by predicate are skipped over without being written.
+    Some members need data from earlier in the archive: a link tarfile can't
+    create (no symlink support, or a hardlink to a skipped member) is
+    extracted as a copy of its target. Those archives fail in streaming
+    mode with StreamError, and are extracted again in seekable mode.
+    """
+    try:
+        with tarfile.open(archive_path, f"r|{compression}") as tar:
+            members = None
+            if predicate is not None:
+                members = (m for m in tar if predicate(m))
+            tar.extractall(dest_dir, members=members, filter="data")
+    except tarfile.StreamError:
+        with tarfile.open(archive_path, f"r:{compression}") as tar:
+            members = None
+            if predicate is not None:
+                members = [m for m in tar if predicate(m)]
+            tar.extractall(dest_dir, members=members, filter="data")
+
+
+def _move_or_copy(src: Path, dest: Path) -> None:
+    """Move src to dest, falling back to a copy across filesystems.
+
+    A rename costs no data copy, and replaces dest atomically (so a running
+    old binary keeps working instead of failing with "text file busy").
+    Symlinks are copied (following the link), as moving them could leave
+    them dangling.
+    """
+    if not src.is_symlink():
+        try:
+            os.replace(src, dest)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dest)
+
+
 def install_binaries(
     source_dir: Path,
     bin_dir: Path | None = None,
 ) -> list[str]:
     """Install executables from extracted directory to bin directory.
 
+    Executables are moved out of source_dir where possible, so it should be
+    a temporary extraction directory.
+
     Returns list of installed binary names.
     """
     if bin_dir is None:
@@ -189,9 +347,12 @@ def install_binaries(
     executables = find_executables(source_dir)
     installed = []
 
+    # Copy symlinks before any file they point to is moved away
+    executables.sort(key=lambda p: not p.is_symlink())
+
     for exe in executables:
         dest = bin_dir / exe.name
-        shutil.copy2(exe, dest)
+        _move_or_copy(exe, dest)
         make_executable(dest)
         installed.append(exe.name)
 
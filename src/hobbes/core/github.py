@@ -1,13 +1,32 @@
 """GitHub API client for fetching releases."""
 
+import importlib.util
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import httpx
 
+from hobbes.core.cache import ResponseCache
 from hobbes.models.release import Release
 
 
 GITHUB_API_BASE = "https://api.github.com"
 
+# Maximum number of concurrent API requests for bulk lookups
+MAX_WORKERS = 16
+
+# Fields of release and asset objects that Release.from_api_response reads;
+# everything else (release notes, author and uploader objects, ...) is dropped
+# before caching
+RELEASE_FIELDS = (
+    "tag_name", "name", "prerelease", "draft", "published_at",
+    "tarball_url", "zipball_url",
+)
+ASSET_FIELDS = ("name", "browser_download_url", "size", "content_type")
+
 
 class GitHubError(Exception):
     """Error from GitHub API."""
@@ -38,42 +57,151 @@ def parse_repo_spec(spec: str) -> tuple[str, str]:
     raise ValueError(f"Invalid repo spec: {spec}. Use 'owner/repo' or GitHub URL.")
 
 
+def _trim_release_body(body: Any) -> Any:
+    """Reduce a release (or list of releases) API body to the fields hobbes uses."""
+    if isinstance(body, list):
+        return [_trim_release_body(item) for item in body]
+    if not isinstance(body, dict):
+        return body
+
+    release = {key: body[key] for key in RELEASE_FIELDS if key in body}
+    release["assets"] = [
+        {key: asset[key] for key in ASSET_FIELDS if key in asset}
+        for asset in body.get("assets", [])
+    ]
+    return release
+
+
+def _create_http_client() -> httpx.Client:
+    """Create the HTTP client used for GitHub API requests."""
+    return httpx.Client(
+        base_url=GITHUB_API_BASE,
+        headers={
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+        timeout=30.0,
+        # Keep enough connections alive for concurrent bulk lookups
+        limits=httpx.Limits(
+            max_connections=MAX_WORKERS,
+            max_keepalive_connections=MAX_WORKERS,
+        ),
+        # HTTP/2 multiplexes concurrent requests over one connection, but
+        # needs the optional h2 package
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+
+
 class GitHubClient:
-    """Client for interacting with GitHub API."""
+    """Client for interacting with GitHub API.
+
+    All instances share one HTTP client (and its keep-alive connection pool)
+    and one response cache, which are closed and saved when the outermost
+    client context exits.
+    """
+
+    _lock = threading.Lock()
+    _shared_client: httpx.Client | None = None
+    _shared_cache: ResponseCache | None = None
+    _refcount = 0
+    # Time (epoch seconds) until which the rate limit is known to be exhausted
+    _rate_limit_reset = 0.0
 
     def __init__(self):
-        self.client = httpx.Client(
-            base_url=GITHUB_API_BASE,
-            headers={
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            },
-            timeout=30.0,
-        )
+        with GitHubClient._lock:
+            if GitHubClient._shared_client is None:
+                GitHubClient._shared_client = _create_http_client()
+                GitHubClient._shared_cache = ResponseCache()
+            GitHubClient._refcount += 1
+            self.client = GitHubClient._shared_client
+            self.cache = GitHubClient._shared_cache
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
+        with GitHubClient._lock:
+            GitHubClient._refcount -= 1
+            if GitHubClient._refcount > 0:
+                return
+            GitHubClient._shared_client = None
+            GitHubClient._shared_cache = None
+
         self.client.close()
+        self.cache.save()
+
+    def _get_json(self, path: str, params: dict | None = None) -> tuple[int, Any]:
+        """GET a JSON endpoint, revalidating cached responses with the server.
+
+        Returns (status_code, parsed body), with releases trimmed to the
+        fields Release reads. A 304 response is reported as 200 with the
+        cached body. Recent 404s and empty results are answered from the
+        cache without a request. Errors other than 403/404 are raised.
+        """
+        url = str(self.client.build_request("GET", path, params=params).url)
+        entry = self.cache.get(url)
+        if entry is not None and entry.get("negative"):
+            return entry["status"], entry["body"]
+
+        # Once the rate limit is exhausted, don't spend requests that will be
+        # refused; serve what's cached until the limit resets
+        if time.time() < GitHubClient._rate_limit_reset:
+            if entry is not None:
+                return 200, entry["body"]
+            return 403, None
+
+        headers = self.cache.conditional_headers(entry) if entry else None
+
+        response = self.client.get(path, params=params, headers=headers)
+        self._track_rate_limit(response)
+
+        if response.status_code == 304 and entry is not None:
+            return 200, entry["body"]
+        if response.status_code == 404:
+            self.cache.put_negative(url, 404)
+            return 404, None
+        if response.status_code == 403:
+            return 403, None
+        response.raise_for_status()
+
+        body = _trim_release_body(response.json())
+        if not body:
+            self.cache.put_negative(url, response.status_code, body)
+            return response.status_code, body
+        self.cache.put(
+            url,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return response.status_code, body
+
+    def _track_rate_limit(self, response: httpx.Response) -> None:
+        """Record when the rate limit resets if the response exhausted it."""
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+        try:
+            reset = float(response.headers.get("X-RateLimit-Reset", ""))
+        except ValueError:
+            return
+        GitHubClient._rate_limit_reset = max(GitHubClient._rate_limit_reset, reset)
 
     def get_releases(
         self, owner: str, repo: str, per_page: int = 30
     ) -> list[Release]:
         """Get releases for a repository."""
-        response = self.client.get(
+        status, body = self._get_json(
             f"/repos/{owner}/{repo}/releases",
             params={"per_page": per_page},
         )
 
-        if response.status_code == 404:
+        if status == 404:
             raise GitHubError(f"Repository {owner}/{repo} not found")
-        if response.status_code == 403:
+        if status == 403:
             raise GitHubError("GitHub API rate limit exceeded")
-        response.raise_for_status()
 
         releases = []
-        for data in response.json():
+        for data in body:
             release = Release.from_api_response(data)
             if not release.draft:  # Skip draft releases
                 releases.append(release)
@@ -82,9 +210,9 @@ class GitHubClient:
 
     def get_latest_release(self, owner: str, repo: str) -> Release:
         """Get the latest non-prerelease release."""
-        response = self.client.get(f"/repos/{owner}/{repo}/releases/latest")
+        status, body = self._get_json(f"/repos/{owner}/{repo}/releases/latest")
 
-        if response.status_code == 404:
+        if status == 404:
             # Fall back to getting all releases and finding first non-prerelease
             releases = self.get_releases(owner, repo)
             for release in releases:
@@ -93,19 +221,46 @@ class GitHubClient:
             if releases:
                 return releases[0]
             raise GitHubError(f"No releases found for {owner}/{repo}")
+        if status == 403:
+            raise GitHubError("GitHub API rate limit exceeded")
 
-        response.raise_for_status()
-        return Release.from_api_response(response.json())
+        return Release.from_api_response(body)
+
+    def get_latest_releases(
+        self, repos: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], Release]:
+        """Get the latest release for several repositories at once.
+
+        Lookups run concurrently over the shared connection pool. Repositories
+        whose release can't be fetched are omitted from the result.
+        """
+        if not repos:
+            return {}
+
+        releases = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(repos))) as executor:
+            futures = {
+                executor.submit(self.get_latest_release, owner, repo): (owner, repo)
+                for owner, repo in repos
+            }
+            for future, key in futures.items():
+                try:
+                    releases[key] = future.result()
+                except GitHubError:
+                    pass
+
+        return releases
 
     def get_release_by_tag(self, owner: str, repo: str, tag: str) -> Release:
         """Get a specific release by tag name."""
-        response = self.client.get(f"/repos/{owner}/{repo}/releases/tags/{tag}")
+        status, body = self._get_json(f"/repos/{owner}/{repo}/releases/tags/{tag}")
 
-        if response.status_code == 404:
+        if status == 404:
             raise GitHubError(f"Release {tag} not found for {owner}/{repo}")
-        response.raise_for_status()
+        if status == 403:
+            raise GitHubError("GitHub API rate limit exceeded")
 
-        return Release.from_api_response(response.json())
+        return Release.from_api_response(body)
 
     def search_repos(self, query: str, per_page: int = 10) -> list[dict]:
         """Search for repositories."""
@@ -1,10 +1,20 @@
 """Manifest file management for tracking installed packages."""
 
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+from typing import Iterator
+import os
+import tempfile
 import yaml
 
-from hobbes.core.config import get_config
+# Prefer the libyaml C bindings, which parse and emit much faster
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+from hobbes.core.config import get_config, replacement_mode
 from hobbes.models.package import Package
 
 
@@ -14,19 +24,39 @@ MANIFEST_VERSION = 1
 class Manifest:
     """Manages the hobbes manifest file."""
 
+    # Parsed manifest data by path, reused while the file's mtime is unchanged.
+    # Package.to_dict/from_dict copy the binaries list, so cached data never
+    # shares a mutable object with a live Package.
+    _cache: dict[Path, tuple[int, dict]] = {}
+
     def __init__(self, path: Path | None = None):
         self.path = path or get_config().manifest_path
-        self._packages: dict[str, Package] = {}
-        self._load()
+        # Parsed on first use, so commands that exit early skip the parse
+        self._packages: dict[str, Package] | None = None
+        self._deferred = False
+        self._dirty = False
+
+    def _ensure_loaded(self) -> dict[str, Package]:
+        """Load the manifest if it hasn't been loaded yet."""
+        if self._packages is None:
+            self._load()
+        return self._packages
 
     def _load(self) -> None:
         """Load manifest from file."""
-        if not self.path.exists():
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
             self._packages = {}
             return
 
-        with open(self.path) as f:
-            data = yaml.safe_load(f) or {}
+        cached = Manifest._cache.get(self.path)
+        if cached is not None and cached[0] == mtime:
+            data = cached[1]
+        else:
+            with open(self.path) as f:
+                data = yaml.load(f, Loader=SafeLoader) or {}
+            Manifest._cache[self.path] = (mtime, data)
 
         packages_data = data.get("packages", {})
         self._packages = {
@@ -36,54 +66,90 @@ class Manifest:
 
     def save(self) -> None:
         """Save manifest to file."""
+        packages = self._ensure_loaded()
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
             "version": MANIFEST_VERSION,
             "packages": {
-                name: pkg.to_dict() for name, pkg in self._packages.items()
+                name: pkg.to_dict() for name, pkg in packages.items()
             },
         }
 
-        with open(self.path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Write to a temp file and rename so the manifest is never left
+        # half-written
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".manifest")
+        try:
+            with os.fdopen(fd, "w") as f:
+                yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+            os.chmod(tmp_path, replacement_mode(self.path))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._dirty = False
+        Manifest._cache[self.path] = (self.path.stat().st_mtime_ns, data)
+
+    @contextmanager
+    def defer_save(self) -> Iterator[None]:
+        """Save once when the block exits instead of after every change."""
+        previous = self._deferred
+        self._deferred = True
+        try:
+            yield
+        finally:
+            self._deferred = previous
+            if not previous and self._dirty:
+                self.save()
+
+    def _changed(self) -> None:
+        """Persist a change now, or at the end of a defer_save block."""
+        if self._deferred:
+            self._dirty = True
+        else:
+            self.save()
 
     def get(self, name: str) -> Package | None:
         """Get a package by name."""
-        return self._packages.get(name)
+        return self._ensure_loaded().get(name)
 
     def add(self, package: Package) -> None:
         """Add or update a package."""
-        self._packages[package.name] = package
-        self.save()
+        self._ensure_loaded()[package.name] = package
+        self._changed()
 
     def remove(self, name: str) -> Package | None:
         """Remove a package by name."""
-        package = self._packages.pop(name, None)
+        package = self._ensure_loaded().pop(name, None)
         if package:
-            self.save()
+            self._changed()
         return package
 
     def list_packages(self) -> list[Package]:
         """List all installed packages."""
-        return list(self._packages.values())
+        return list(self._ensure_loaded().values())
 
     def has(self, name: str) -> bool:
         """Check if a package is installed."""
-        return name in self._packages
+        return name in self._ensure_loaded()
 
     def pin(self, name: str) -> bool:
         """Pin a package to its current version."""
-        if name in self._packages:
-            self._packages[name].pinned = True
-            self.save()
+        package = self._ensure_loaded().get(name)
+        if package is not None:
+            if not package.pinned:
+                package.pinned = True
+                self._changed()
             return True
         return False
 
     def unpin(self, name: str) -> bool:
         """Unpin a package."""
-        if name in self._packages:
-            self._packages[name].pinned = False
-            self.save()
+        package = self._ensure_loaded().get(name)
+        if package is not None:
+            if package.pinned:
+                package.pinned = False
+                self._changed()
             return True
         return False
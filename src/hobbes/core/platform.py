@@ -1,13 +1,21 @@
 """Platform detection and asset matching."""
 
+import functools
 import platform
 import re
 from dataclasses import dataclass
+from typing import Callable
 
 from hobbes.models.release import Asset
 
+# pyahocorasick finds every OS/arch keyword in one pass over the name
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+
+@dataclass(slots=True)
 class PlatformInfo:
     """Current platform information."""
 
@@ -17,8 +25,9 @@ class PlatformInfo:
     @classmethod
     def detect(cls) -> "PlatformInfo":
         """Detect current platform."""
-        system = platform.system().lower()
-        machine = platform.machine().lower()
+        uname = platform.uname()
+        system = uname.system.lower()
+        machine = uname.machine.lower()
 
         # Normalize OS
         if system == "darwin":
@@ -58,64 +67,130 @@ ARCH_PATTERNS = {
 }
 
 
+def _build_keyword_automaton():
+    """Build an automaton mapping each lowercase keyword to (kind, value)."""
+    automaton = ahocorasick.Automaton()
+    for kind, patterns in (("os", OS_PATTERNS), ("arch", ARCH_PATTERNS)):
+        for value, keywords in patterns.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, (kind, value))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+UNIVERSAL_REGEX = re.compile(r"(universal|any|all)", re.IGNORECASE)
+
+# Extensions of files that are never binaries (checksums, signatures, docs)
+SKIP_EXT = (".txt", ".md", ".sha256", ".sig", ".asc", ".sbom")
+
+# Score bonus for preferred archive formats
+ARCHIVE_BONUS = {".tar.gz": 10, ".tgz": 10, ".zip": 8, ".tar.xz": 6}
+
+
+def _build_platform_regex(os_name: str, arch: str) -> re.Pattern:
+    """Build one regex finding a platform's OS keywords, arch keywords and archive suffix.
+
+    Each alternative sits in its own named group inside a lookahead, so matches
+    are zero-width and one finditer pass reports keywords even where they
+    overlap (e.g. "osx64").
+    """
+    def alternation(patterns: list[str]) -> str:
+        # Longest literals first, so a shorter shared prefix (win vs. win64)
+        # is not tried first and backtracked out of
+        return "|".join(sorted(patterns, key=len, reverse=True))
+
+    groups = []
+    if os_name in OS_PATTERNS:
+        groups.append(f"(?P<os>{alternation(OS_PATTERNS[os_name])})")
+    if arch in ARCH_PATTERNS:
+        groups.append(f"(?P<arch>{alternation(ARCH_PATTERNS[arch])})")
+    groups.append(f"(?P<ext>{'|'.join(re.escape(ext) + '$' for ext in ARCHIVE_BONUS)})")
+    return re.compile(f"(?=(?:{'|'.join(groups)}))", re.IGNORECASE)
+
+
 def score_asset(asset: Asset, platform_info: PlatformInfo) -> int:
     """Score an asset based on platform match. Higher is better, -1 means no match."""
-    name = asset.name.lower()
-
-    # Skip non-binary files
-    skip_extensions = [".txt", ".md", ".sha256", ".sig", ".asc", ".sbom"]
-    if any(name.endswith(ext) for ext in skip_extensions):
-        return -1
-
-    # Check for binary/archive extensions
-    binary_extensions = [".tar.gz", ".tgz", ".zip", ".tar.xz", ".gz", ".exe", ""]
-    has_valid_extension = any(
-        name.endswith(ext) for ext in binary_extensions if ext
-    ) or "." not in name.split("/")[-1].rsplit("-", 1)[-1]
-
-    if not has_valid_extension:
-        # Check if it might be a raw binary (no extension or executable)
-        pass
-
-    score = 0
-
-    # Match OS
-    os_matched = False
-    for pattern in OS_PATTERNS.get(platform_info.os, []):
-        if re.search(pattern, name, re.IGNORECASE):
-            os_matched = True
-            score += 100
-            break
+    return make_scorer(platform_info)(asset)
 
-    # Match architecture
-    arch_matched = False
-    for pattern in ARCH_PATTERNS.get(platform_info.arch, []):
-        if re.search(pattern, name, re.IGNORECASE):
-            arch_matched = True
-            score += 50
-            break
 
-    # Require at least OS match
-    if not os_matched:
-        # Check if this might be a universal/any-platform binary
-        if re.search(r"(universal|any|all)", name, re.IGNORECASE):
+def make_scorer(platform_info: PlatformInfo) -> Callable[[Asset], int]:
+    """Build a score_asset equivalent specialized for one platform.
+
+    Use this when scoring many assets for the same platform.
+    """
+    score_name = _name_scorer(platform_info.os, platform_info.arch)
+
+    def scorer(asset: Asset) -> int:
+        return score_name(asset.name_lower)
+
+    return scorer
+
+
+@functools.lru_cache(maxsize=None)
+def _name_scorer(os_name: str, arch: str) -> Callable[[str], int]:
+    """Build a memoized name scorer with the platform's matchers bound up front."""
+    os_key = ("os", os_name)
+    arch_key = ("arch", arch)
+    platform_regex = _build_platform_regex(os_name, arch)
+    automaton = KEYWORD_AUTOMATON
+
+    @functools.lru_cache(maxsize=4096)
+    def score_name(name: str) -> int:
+        # Takes the lowercased asset name, as the extension checks and the
+        # automaton's lowercase keywords need it
+
+        # Skip non-binary files
+        if name.endswith(SKIP_EXT):
+            return -1
+
+        score = 0
+
+        # Match OS and architecture, and find the archive bonus
+        if automaton is not None:
+            # Keywords are lowercase literals, so scan the lowercased name
+            found = {match for _, match in automaton.iter(name)}
+            os_matched = os_key in found
+            arch_matched = arch_key in found
+            bonus = next(
+                (bonus for ext, bonus in ARCHIVE_BONUS.items() if name.endswith(ext)), 0
+            )
+        else:
+            # One pass of the platform regex reports all three
+            os_matched = arch_matched = False
+            bonus = 0
+            for match in platform_regex.finditer(name):
+                group = match.lastgroup
+                if group == "os":
+                    os_matched = True
+                elif group == "arch":
+                    arch_matched = True
+                else:
+                    bonus = ARCHIVE_BONUS[match.group(group)]
+
+        # Require at least OS match
+        if os_matched:
+            score += 100
+        elif UNIVERSAL_REGEX.search(name):
+            # Might be a universal/any-platform binary
             score += 10
         else:
             return -1
 
-    # Prefer exact matches
-    if os_matched and arch_matched:
-        score += 25
+        if arch_matched:
+            score += 50
 
-    # Prefer certain archive formats
-    if name.endswith(".tar.gz") or name.endswith(".tgz"):
-        score += 10
-    elif name.endswith(".zip"):
-        score += 8
-    elif name.endswith(".tar.xz"):
-        score += 6
+        # Prefer exact matches
+        if os_matched and arch_matched:
+            score += 25
 
-    return score
+        # Prefer certain archive formats
+        score += bonus
+
+        return score
+
+    return score_name
 
 
 def find_best_assets(assets: list[Asset], platform_info: PlatformInfo | None = None) -> list[Asset]:
@@ -124,22 +199,20 @@ def find_best_assets(assets: list[Asset], platform_info: PlatformInfo | None = N
     Returns multiple assets if they tie for the highest score.
     """
     if platform_info is None:
-        platform_info = PlatformInfo.detect()
+        platform_info = get_platform_info()
 
+    scorer = make_scorer(platform_info)
     scored = []
     for asset in assets:
-        score = score_asset(asset, platform_info)
+        score = scorer(asset)
         if score >= 0:
             scored.append((score, asset))
 
     if not scored:
         return []
 
-    # Sort by score descending
-    scored.sort(key=lambda x: x[0], reverse=True)
-
-    # Return all assets with the top score
-    top_score = scored[0][0]
+    # Return all assets with the top score, in their original order
+    top_score = max(score for score, _ in scored)
     return [asset for score, asset in scored if score == top_score]
 
 
@@ -149,6 +222,7 @@ def find_best_asset(assets: list[Asset], platform_info: PlatformInfo | None = No
     return best[0] if best else None
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_info() -> PlatformInfo:
-    """Get current platform information."""
+    """Get current platform information (detected once per process)."""
     return PlatformInfo.detect()
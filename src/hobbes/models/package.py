@@ -1,10 +1,11 @@
 """Package data model."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Represents an installed package."""
 
@@ -24,7 +25,7 @@ class Package:
             "version": self.version,
             "tag": self.tag,
             "installed_at": self.installed_at.isoformat(),
-            "binaries": self.binaries,
+            "binaries": list(self.binaries),
             "pinned": self.pinned,
             "asset": self.asset,
         }
@@ -33,18 +34,21 @@ class Package:
     def from_dict(cls, name: str, data: dict) -> "Package":
         """Create Package from dictionary."""
         installed_at = data.get("installed_at")
-        if isinstance(installed_at, str):
+        # Saved manifests store an ISO string, so parse first and only fall
+        # back for the rare datetime (YAML-typed) or missing value
+        try:
             installed_at = datetime.fromisoformat(installed_at)
-        elif installed_at is None:
-            installed_at = datetime.now()
+        except TypeError:
+            if installed_at is None:
+                installed_at = datetime.now()
 
         return cls(
             name=name,
-            repo=data["repo"],
+            repo=sys.intern(data["repo"]),
             version=data["version"],
-            tag=data["tag"],
+            tag=sys.intern(data["tag"]),
             installed_at=installed_at,
-            binaries=data.get("binaries", []),
+            binaries=list(data.get("binaries", [])),
             pinned=data.get("pinned", False),
             asset=data.get("asset", ""),
         )
@@ -1,9 +1,10 @@
 """GitHub release data models."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Represents a GitHub release asset."""
 
@@ -11,19 +12,14 @@ class Asset:
     download_url: str
     size: int
     content_type: str
+    # Lowercased name, computed once for the case-insensitive matchers
+    name_lower: str = field(init=False, repr=False, compare=False)
 
-    @classmethod
-    def from_api_response(cls, data: dict) -> "Asset":
-        """Create Asset from GitHub API response."""
-        return cls(
-            name=data["name"],
-            download_url=data["browser_download_url"],
-            size=data["size"],
-            content_type=data.get("content_type", "application/octet-stream"),
-        )
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class Release:
     """Represents a GitHub release."""
 
@@ -35,11 +31,27 @@ class Release:
     published_at: str
     tarball_url: str = ""
     zipball_url: str = ""
+    # Version string (tag without 'v' prefix if present), derived once
+    version: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.version = self.tag_name.removeprefix("v")
 
     @classmethod
     def from_api_response(cls, data: dict) -> "Release":
         """Create Release from GitHub API response."""
-        assets = [Asset.from_api_response(a) for a in data.get("assets", [])]
+        # Assets are built inline rather than through a classmethod to save a
+        # call per asset on large releases. Nearly every asset shares one of a
+        # few content types, so those strings are interned.
+        assets = [
+            Asset(
+                a["name"],
+                a["browser_download_url"],
+                a["size"],
+                sys.intern(a.get("content_type") or "application/octet-stream"),
+            )
+            for a in data.get("assets", [])
+        ]
         return cls(
             tag_name=data["tag_name"],
             name=data.get("name") or data["tag_name"],
@@ -50,11 +62,3 @@ class Release:
             tarball_url=data.get("tarball_url", ""),
             zipball_url=data.get("zipball_url", ""),
         )
-
-    @property
-    def version(self) -> str:
-        """Get version string (tag without 'v' prefix if present)."""
-        tag = self.tag_name
-        if tag.startswith("v"):
-            return tag[1:]
-        return tag
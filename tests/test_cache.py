@@ -0,0 +1,146 @@
+"""Tests for the GitHub API response cache."""
+
+import json
+
+import pytest
+
+from hobbes.core import cache as cache_module
+from hobbes.core.cache import MAX_AGE, NEGATIVE_TTL, ResponseCache
+from hobbes.core.config import HobbesConfig, set_config
+from hobbes.core.github import GitHubClient
+
+
+LATEST_URL = "https://api.github.com/repos/owner/tool/releases/latest"
+
+RELEASE_BODY = {
+    "tag_name": "v1.0.0",
+    "name": "Tool 1.0.0",
+    "body": "Long release notes that hobbes never reads",
+    "author": {"login": "someone"},
+    "prerelease": False,
+    "draft": False,
+    "published_at": "2024-01-01T00:00:00Z",
+    "assets": [
+        {
+            "name": "tool-linux-amd64.tar.gz",
+            "browser_download_url": "https://example.com/tool-linux-amd64.tar.gz",
+            "size": 1234,
+            "content_type": "application/gzip",
+            "uploader": {"login": "someone"},
+        }
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def hobbes_home(tmp_path):
+    set_config(HobbesConfig(
+        base_dir=tmp_path,
+        bin_dir=tmp_path / "bin",
+        cache_dir=tmp_path / "cache",
+        manifest_path=tmp_path / "manifest.yaml",
+    ))
+    GitHubClient._rate_limit_reset = 0.0
+    yield tmp_path
+    set_config(None)
+
+
+def age(cache: ResponseCache, url: str, seconds: float) -> None:
+    """Make a cache entry look older than it is."""
+    cache._entries[url]["timestamp"] -= seconds
+
+
+def test_not_modified_response_reuses_cached_body(httpx_mock):
+    httpx_mock.add_response(url=LATEST_URL, json=RELEASE_BODY, headers={"ETag": '"abc"'})
+    httpx_mock.add_response(url=LATEST_URL, status_code=304)
+
+    with GitHubClient() as client:
+        first = client.get_latest_release("owner", "tool")
+
+    # A fresh client reads the saved cache and revalidates the entry
+    with GitHubClient() as client:
+        second = client.get_latest_release("owner", "tool")
+
+    assert second == first
+    assert second.tag_name == "v1.0.0"
+    assert second.assets[0].name == "tool-linux-amd64.tar.gz"
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"abc"'
+
+
+def test_cached_body_keeps_only_release_fields(httpx_mock, hobbes_home):
+    httpx_mock.add_response(url=LATEST_URL, json=RELEASE_BODY)
+
+    with GitHubClient() as client:
+        client.get_latest_release("owner", "tool")
+
+    saved = json.loads((hobbes_home / "cache" / cache_module.CACHE_FILENAME).read_text())
+    body = saved[LATEST_URL]["body"]
+    assert "body" not in body
+    assert "author" not in body
+    assert "uploader" not in body["assets"][0]
+    assert body["assets"][0]["browser_download_url"].endswith(".tar.gz")
+
+
+def test_negative_entry_expires_after_ttl(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.json")
+    cache.put_negative(LATEST_URL, 404)
+    assert cache.get(LATEST_URL)["status"] == 404
+
+    age(cache, LATEST_URL, NEGATIVE_TTL + 1)
+    assert cache.get(LATEST_URL) is None
+
+
+def test_recent_404_is_answered_without_a_request(httpx_mock):
+    httpx_mock.add_response(url=LATEST_URL, status_code=404)
+
+    with GitHubClient() as client:
+        assert client._get_json("/repos/owner/tool/releases/latest") == (404, None)
+        assert client._get_json("/repos/owner/tool/releases/latest") == (404, None)
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_save_drops_expired_entries(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = ResponseCache(path)
+    cache.put("https://api.github.com/fresh", {"tag_name": "v1"})
+    cache.put("https://api.github.com/stale", {"tag_name": "v0"})
+    cache.put_negative("https://api.github.com/missing", 404)
+    age(cache, "https://api.github.com/stale", MAX_AGE + 1)
+    age(cache, "https://api.github.com/missing", NEGATIVE_TTL + 1)
+
+    cache.save()
+
+    assert list(json.loads(path.read_text())) == ["https://api.github.com/fresh"]
+
+
+def test_save_keeps_only_newest_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "MAX_ENTRIES", 2)
+    path = tmp_path / "cache.json"
+    cache = ResponseCache(path)
+    for i in range(4):
+        url = f"https://api.github.com/{i}"
+        cache.put(url, {"tag_name": f"v{i}"})
+        age(cache, url, 10 * (4 - i))
+
+    cache.save()
+
+    assert sorted(json.loads(path.read_text())) == [
+        "https://api.github.com/2",
+        "https://api.github.com/3",
+    ]
+
+
+def test_unused_cache_is_never_read(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("not json")
+
+    cache = ResponseCache(path)
+    cache.save()
+
+    assert cache._entries is None
+    assert path.read_text() == "not json"
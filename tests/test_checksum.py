@@ -0,0 +1,26 @@
+"""Tests for checksum file lookup."""
+
+from hobbes.core.checksum import find_checksum_asset
+from hobbes.models.release import Asset
+
+
+def make_assets(*names: str) -> list[Asset]:
+    return [
+        Asset(name, f"https://example.com/{name}", 1, "application/octet-stream")
+        for name in names
+    ]
+
+
+def test_prefers_checksum_file_named_after_target():
+    assets = make_assets("checksums.txt", "tool-linux-amd64", "tool-linux-amd64.sha256")
+    assert find_checksum_asset(assets, assets[1]).name == "tool-linux-amd64.sha256"
+
+
+def test_ignores_sibling_assets_checksum_file():
+    assets = make_assets(
+        "checksums.txt",
+        "tool-linux-amd64",
+        "tool-linux-amd64-musl",
+        "tool-linux-amd64-musl.sha256",
+    )
+    assert find_checksum_asset(assets, assets[1]).name == "checksums.txt"
@@ -0,0 +1,124 @@
+"""Tests for archive extraction and binary installation."""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from hobbes.core.config import HobbesConfig, set_config
+from hobbes.core.extractor import (
+    ExtractionError,
+    extract_archive,
+    install_binaries,
+    is_binary_candidate,
+)
+
+
+ELF = b"\x7fELF" + b"\x00" * 60
+
+
+def add_file(tar: tarfile.TarFile, name: str, data: bytes, mode: int = 0o644) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    tar.addfile(info, io.BytesIO(data))
+
+
+def add_link(tar: tarfile.TarFile, name: str, target: str, kind: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.type = kind
+    info.linkname = target
+    tar.addfile(info)
+
+
+def tar_member(name: str, mode: int = 0o644) -> tarfile.TarInfo:
+    info = tarfile.TarInfo(name)
+    info.mode = mode
+    return info
+
+
+def test_man_pages_are_only_skipped_under_a_man_directory():
+    assert not is_binary_candidate(tar_member("tool/share/man/man1/tool.1"))
+    assert not is_binary_candidate(tar_member("tool/man/tool.8"))
+    assert not is_binary_candidate(tar_member("tool/README.md"))
+    assert is_binary_candidate(tar_member("tool/bin/lua5.1"))
+    assert is_binary_candidate(tar_member("tool/tool"))
+
+
+def test_executable_and_link_members_are_always_kept():
+    assert is_binary_candidate(tar_member("tool/man/tool.1", mode=0o755))
+    assert is_binary_candidate(tar_member("tool/notes.txt", mode=0o755))
+
+    symlink = tar_member("tool/share/man/man1/alias.1")
+    symlink.type = tarfile.SYMTYPE
+    assert is_binary_candidate(symlink)
+
+    zip_member = zipfile.ZipInfo("tool/man/tool.1")
+    zip_member.external_attr = 0o755 << 16
+    assert is_binary_candidate(zip_member)
+    assert not is_binary_candidate(zipfile.ZipInfo("tool/man/tool.1"))
+
+
+def test_versioned_executables_are_installed(tmp_path):
+    archive = tmp_path / "python.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        add_file(tar, "python/bin/python3.8", ELF, mode=0o755)
+        add_link(tar, "python/bin/python", "python3.8", tarfile.SYMTYPE)
+        add_file(tar, "python/bin/lua5.1", ELF, mode=0o755)
+        add_file(tar, "python/bin/tool", ELF, mode=0o755)
+        add_file(tar, "python/share/man/man1/python3.8.1", b".TH PYTHON 1\n")
+        add_file(tar, "python/README.md", b"# python\n")
+
+    extracted = extract_archive(archive, tmp_path / "out", predicate=is_binary_candidate)
+
+    assert not (extracted / "python/share/man/man1/python3.8.1").exists()
+    assert not (extracted / "python/README.md").exists()
+
+    installed = install_binaries(extracted, tmp_path / "bin")
+    assert sorted(installed) == ["lua5.1", "python", "python3.8", "tool"]
+
+
+def test_hardlink_to_skipped_member_is_extracted(tmp_path):
+    archive = tmp_path / "h.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        add_file(tar, "d/man/tool.1", ELF)
+        add_link(tar, "d/tool", "d/man/tool.1", tarfile.LNKTYPE)
+
+    extracted = extract_archive(archive, tmp_path / "out", predicate=is_binary_candidate)
+
+    assert (extracted / "d/tool").read_bytes() == ELF
+
+
+def test_links_fall_back_to_copies_without_symlink_support(tmp_path, monkeypatch):
+    archive = tmp_path / "t.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        add_file(tar, "t/bin/tool", ELF, mode=0o755)
+        add_link(tar, "t/bin/tool2", "tool", tarfile.SYMTYPE)
+
+    def no_symlink(*args, **kwargs):
+        raise OSError("symlinks not supported")
+
+    monkeypatch.setattr("os.symlink", no_symlink)
+
+    for dest, predicate in (("plain", None), ("filtered", is_binary_candidate)):
+        extracted = extract_archive(archive, tmp_path / dest, predicate=predicate)
+        assert (extracted / "t/bin/tool2").read_bytes() == ELF
+
+
+def test_failed_extraction_removes_its_temp_directory(tmp_path):
+    set_config(HobbesConfig(
+        base_dir=tmp_path,
+        bin_dir=tmp_path / "bin",
+        cache_dir=tmp_path / "cache",
+        manifest_path=tmp_path / "manifest.yaml",
+    ))
+    archive = tmp_path / "corrupt.tar.gz"
+    archive.write_bytes(b"not a tarball")
+
+    try:
+        with pytest.raises(ExtractionError):
+            extract_archive(archive)
+        assert list((tmp_path / "cache").iterdir()) == []
+    finally:
+        set_config(None)
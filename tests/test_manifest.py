@@ -0,0 +1,37 @@
+"""Tests for the manifest file."""
+
+from datetime import datetime
+
+from hobbes.core.manifest import Manifest
+from hobbes.models.package import Package
+
+
+def make_package(name: str = "tool") -> Package:
+    return Package(
+        name=name,
+        repo=f"owner/{name}",
+        version="1.0.0",
+        tag="v1.0.0",
+        installed_at=datetime(2024, 1, 1),
+        binaries=[name],
+    )
+
+
+def test_saved_package_changes_do_not_leak_into_cached_data(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    manifest = Manifest(path)
+    package = make_package()
+    manifest.add(package)
+
+    package.binaries.append("extra")
+
+    assert Manifest(path).get("tool").binaries == ["tool"]
+
+
+def test_loaded_packages_do_not_share_cached_data(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    Manifest(path).add(make_package())
+
+    Manifest(path).get("tool").binaries.append("extra")
+
+    assert Manifest(path).get("tool").binaries == ["tool"]